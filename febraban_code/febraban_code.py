@@ -1,7 +1,185 @@
-from datetime import datetime, timedelta, date
-from typing import Dict, Union
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import timedelta, date
+from functools import lru_cache
+from itertools import cycle, islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 import re
 
+_CODE_RE = re.compile(r"[0-9.\-\s]+", re.ASCII)
+_SEPARATORS = str.maketrans("", "", ".- \t\n\r\f\v")
+_LUHN_SINGLE = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLE = bytes.maketrans(b"0123456789", bytes(d * 2 // 10 + d * 2 % 10 for d in range(10)))
+_CODE_TYPES = {47: "line", 44: "bar"}
+_EXPIRY_BASE = date(1997, 10, 7)
+_MODULE_11_WEIGHTS: Dict[int, Tuple[int, ...]] = {}
+
+
+def _get_module_11_weights(length: int) -> Tuple[int, ...]:
+    """
+    - length : int
+        The length of the number to be weighted.
+
+    Returns the module 11 multipliers (4, 3, 2, 9, 8, ..., 2, 9, ...) for the given length.
+    """
+    weights = _MODULE_11_WEIGHTS.get(length)
+    if weights is None:
+        weights = _MODULE_11_WEIGHTS[length] = tuple(islice(cycle((4, 3, 2, 9, 8, 7, 6, 5)), length))
+    return weights
+
+
+def _get_dv_module_10(digits: bytes) -> int:
+    """
+    - digits : bytes
+        The ASCII digits for which to calculate the module 10 check digit.
+
+    Returns the calculated check digit.
+    """
+    total = sum(digits[-1::-2].translate(_LUHN_DOUBLE)) + sum(digits[-2::-2].translate(_LUHN_SINGLE))
+    return -total % 10
+
+
+def _get_dv_module_11(digits: bytes) -> int:
+    """
+    - digits : bytes
+        The ASCII digits for which to calculate the module 11 check digit.
+
+    Returns the calculated check digit.
+    """
+    weights = _get_module_11_weights(len(digits))
+    total = sum((digit - 48) * weight for digit, weight in zip(digits, weights))
+
+    dv = 11 - total % 11
+    return dv if 0 < dv < 10 else 1
+
+
+def _get_bar_fields_dv(bar: str) -> Tuple[int, int, int]:
+    """
+    - bar : str
+        The bar string to calculate the line field check digits from.
+
+    Returns the module 10 check digits of the three line fields, computed from a single
+    translation of the bar. Field 1 is bank + currency + bar[19:24], field 2 is bar[24:34]
+    and field 3 is bar[34:44]; in each one, digits at an even distance from the end are doubled.
+    """
+    digits = bar.encode()
+    single, double = digits.translate(_LUHN_SINGLE), digits.translate(_LUHN_DOUBLE)
+    total_1 = sum(double[0:4:2]) + sum(single[1:4:2]) + sum(double[19:24:2]) + sum(single[20:24:2])
+    total_2 = sum(double[25:34:2]) + sum(single[24:34:2])
+    total_3 = sum(double[35:44:2]) + sum(single[34:44:2])
+    return -total_1 % 10, -total_2 % 10, -total_3 % 10
+
+
+@lru_cache(maxsize=4096)
+def _get_expiry(expiry_factor: str) -> date:
+    """
+    - expiry_factor : str
+        The factor used to calculate the expiry date.
+
+    Returns the calculated expiry date.
+    """
+    return _EXPIRY_BASE + timedelta(days=int(expiry_factor))
+
+
+def _convert_value_factor(value: str) -> float:
+    """
+    - value : str
+        The value factor to convert.
+
+    Returns the converted value into float.
+    """
+    return int(value) / 100
+
+
+def _is_valid(code_type: str, code: str) -> bool:
+    """
+    - code_type : str
+        The code type, either "line" or "bar".
+    - code : str
+        The sanitized bar/line code.
+
+    Returns True if the check digits of the bar/line are valid, False otherwise.
+    """
+    digits = code.encode()
+
+    if code_type == "bar":
+        return _get_dv_module_11(digits[:4] + digits[5:]) == digits[4] - 48
+
+    return (_get_dv_module_10(digits[0:9]) == digits[9] - 48
+            and _get_dv_module_10(digits[10:20]) == digits[20] - 48
+            and _get_dv_module_10(digits[21:31]) == digits[31] - 48
+            and _get_dv_module_11(digits[0:4] + digits[33:47] + digits[4:9] + digits[10:20] + digits[21:31]) == digits[32] - 48)
+
+
+@dataclass(slots=True)
+class _CodeInfo:
+    type: str
+    bank: str
+    currency: str
+    field_1_info: str
+    field_1_dv: Union[str, int]
+    field_2_info: str
+    field_2_dv: Union[str, int]
+    field_3_info: str
+    field_3_dv: Union[str, int]
+    dv: str
+    expiry_factor: str
+    expiry: date
+    value_factor: str
+    value: float
+
+
+_LINE_SLICES = {"bank": (0, 3), "currency": (3, 4),
+                "field_1_info": (4, 9), "field_1_dv": (9, 10),
+                "field_2_info": (10, 20), "field_2_dv": (20, 21),
+                "field_3_info": (21, 31), "field_3_dv": (31, 32),
+                "dv": (32, 33), "expiry_factor": (33, 37), "value_factor": (37, 47)}
+_BAR_SLICES = {"bank": (0, 3), "currency": (3, 4), "dv": (4, 5), "expiry_factor": (5, 9), "value_factor": (9, 19),
+               "field_1_info": (19, 24), "field_2_info": (24, 34), "field_3_info": (34, 44)}
+
+
+def _compile_parser(code_type: str, slices: Dict[str, Tuple[int, int]],
+                    prelude_fields: Tuple[str, ...] = (), prelude: str = "") -> Callable[[str], _CodeInfo]:
+    """
+    - code_type : str
+        The code type, either "line" or "bar".
+    - slices : Dict[str, Tuple[int, int]]
+        The (start, end) offsets of each _CodeInfo field sliced from the code.
+    - prelude_fields : Tuple[str, ...], optional
+        The _CodeInfo fields, missing from slices, bound by the prelude.
+    - prelude : str, optional
+        An expression evaluated before building the _CodeInfo, unpacked into prelude_fields.
+
+    Returns a function, generated and compiled at import time, that parses a sanitized code
+    into a _CodeInfo with the offsets unrolled as constant slices.
+    """
+    expressions = {name: f"code[{start}:{end}]" for name, (start, end) in slices.items()}
+    expressions["type"] = repr(code_type)
+    expressions["expiry"] = f"_get_expiry({expressions['expiry_factor']})"
+    expressions["value"] = f"_convert_value_factor({expressions['value_factor']})"
+    expressions.update((name, name) for name in prelude_fields)
+
+    missing = [field.name for field in fields(_CodeInfo) if field.name not in expressions]
+    if missing:
+        raise ValueError(f"{code_type} parser does not bind _CodeInfo fields: {', '.join(missing)}")
+
+    arguments = ", ".join(expressions[field.name] for field in fields(_CodeInfo))
+
+    lines = [f"def _parse_{code_type}(code, _CodeInfo=_CodeInfo, _get_expiry=_get_expiry,",
+             "        _convert_value_factor=_convert_value_factor, _get_bar_fields_dv=_get_bar_fields_dv):"]
+    if prelude_fields:
+        lines.append(f"    {', '.join(prelude_fields)} = {prelude}")
+    lines.append(f"    return _CodeInfo({arguments})")
+
+    namespace = {}
+    exec("\n".join(lines), globals(), namespace)
+    return namespace[f"_parse_{code_type}"]
+
+
+_parse_line = _compile_parser("line", _LINE_SLICES)
+_parse_bar = _compile_parser("bar", _BAR_SLICES, ("field_1_dv", "field_2_dv", "field_3_dv"), "_get_bar_fields_dv(code)")
+_PARSERS = {"line": _parse_line, "bar": _parse_bar}
+
 
 class FebrabanCode:
 
@@ -10,9 +188,11 @@ class FebrabanCode:
         - bar_code : str
             The barcode string to initialize the FebrabanCode object.
         """
-        self.__code_info = self.__get_info_from_code(self.__code_match(bar_code))
+        self.__code_type, self.__code = self.__code_match(bar_code)
+        self.__code_info = _PARSERS[self.__code_type](self.__code)
 
-    def __code_match(self, code: str) -> Dict[str, str]:
+    @staticmethod
+    def __code_match(code: str) -> Tuple[str, str]:
         """
         - code : str
             The barcode/line string to be matched.
@@ -22,148 +202,41 @@ class FebrabanCode:
         if not isinstance(code, str):
             raise AttributeError("bar_code must be a string")
 
-        code = "".join(char for char in code if char.isdigit())
-
-        valid_length = {47: "line", 44: "bar"}
-        if len(code) not in valid_length:
-            raise ValueError("code must be 47 digit characters (line) or 44 digit characters (bar)")
-
-        return {"type": valid_length.get(len(code)), "value": code}
-
-    def __get_dv_module_10(self, number: str) -> int:
-        """
-        - number : str
-            The number for which to calculate the module 10 check digit.
-
-        Returns the calculated check digit.
-        """
-        multipliers = [2, 1] * ((len(number) + 1) // 2)
-        total = 0
-
-        for count, digit in enumerate(number[::-1]):
-            product = int(digit) * multipliers[count]
-            total += product if product < 10 else (product // 10 + product % 10)
-
-        remainder = total % 10
-        dv_calculated = (10 - remainder) if remainder != 0 else 0
-        return dv_calculated
+        if _CODE_RE.fullmatch(code) is None:
+            raise ValueError("code must contain only digits and '.', '-' or whitespace separators")
 
-    def __get_dv_module_11(self, number: str) -> int:
-        """
-        - number : str
-            The number for which to calculate the module 11 check digit.
-
-        Returns the calculated check digit.
-        """
-        multiplier = 4
-        total = 0
-
-        for digit in range(0, len(number)):
-            total += int(number[digit]) * multiplier
-            multiplier = 10 if multiplier == 2 else multiplier
-            multiplier -= 1
-
-        dv = 11 - total % 11
-
-        if dv in {0, 10, 11}:
-            return 1
-
-        return dv
-
-    def __get_expiry(self, expiry_factor: str) -> date:
-        """
-        - expiry_factor : str
-            The factor used to calculate the expiry date.
-
-        Returns the calculated expiry date.
-        """
-        base_date = datetime(1997, 10, 7).date()
-        expiry = base_date + timedelta(days=int(expiry_factor))
-        return expiry
+        code = code.translate(_SEPARATORS)
 
-    def __convert_value_factor(self, value: str) -> float:
-        """
-        - value : str
-            The value factor to convert.
-
-        Returns the converted value into float.
-        """
-        return float(f"{value[:-2]}.{value[-2:]}")
-
-    def __get_info_from_line(self, line: str) -> Dict[str, Union[str, date, float]]:
-        """
-        - line : str
-            The line string to extract information from.
-
-        Returns a dictionary containing the extracted information.
-        """
-        match = re.search(r"(\d{3})(\d{1})(\d{6})(\d{11})(\d{11})(\d{1})(\d{4})(\d{10})", line)
-
-        data = {"type": "line",
-                "bank": match.group(1),
-                "currency": match.group(2),
-                "field_1": {"info": match.group(3)[:-1], "dv": match.group(3)[-1]},
-                "field_2": {"info": match.group(4)[:-1], "dv": match.group(4)[-1]},
-                "field_3": {"info": match.group(5)[:-1], "dv": match.group(5)[-1]},
-                "dv": match.group(6),
-                "expiry_factor": match.group(7),
-                "expiry": self.__get_expiry(match.group(7)),
-                "value_factor": match.group(8),
-                "value": self.__convert_value_factor(match.group(8))}
-
-        return data
-
-    def __get_info_from_bar(self, bar):
-        """
-        - bar : str
-            The bar string to extract information from.
-
-        Returns a dictionary containing the extracted information.
-        """
-        match = re.search(r"(\d{3})(\d{1})(\d{1})(\d{4})(\d{10})(\d{5})(\d{10})(\d{10})", bar)
-
-        data = {"type": "bar",
-                "bank": match.group(1),
-                "currency": match.group(2),
-                "dv": match.group(3),
-                "expiry_factor": match.group(4),
-                "expiry": self.__get_expiry(match.group(4)),
-                "value_factor": match.group(5),
-                "value": self.__convert_value_factor(match.group(5)),
-                "field_1": {"info": match.group(6), "dv": self.__get_dv_module_10(f"{match.group(1)}{match.group(2)}{match.group(6)}")},
-                "field_2": {"info": match.group(7), "dv": self.__get_dv_module_10(f"{match.group(7)}")},
-                "field_3": {"info": match.group(8), "dv": self.__get_dv_module_10(f"{match.group(8)}")}}
-
-        return data
-
-    def __get_info_from_code(self, code: str) -> Dict[str, Union[str, float, date]]:
-        """
-        - code : str
-            The bar/line code.
+        code_type = _CODE_TYPES.get(len(code))
+        if code_type is None:
+            raise ValueError("code must be 47 digit characters (line) or 44 digit characters (bar)")
 
-        Returns a dictionary containing the extracted information.
-        """
-        getters = {"line": self.__get_info_from_line, "bar": self.__get_info_from_bar}
-        return getters.get(code["type"])(code["value"])
+        return code_type, code
 
     def get_code_info(self) -> Dict[str, Union[str, float, date]]:
         """
         Returns a dictionary containing the extracted information form line/bar.
         """
-        return self.__code_info
+        info = self.__code_info
+        return {"type": info.type,
+                "bank": info.bank,
+                "currency": info.currency,
+                "field_1": {"info": info.field_1_info, "dv": info.field_1_dv},
+                "field_2": {"info": info.field_2_info, "dv": info.field_2_dv},
+                "field_3": {"info": info.field_3_info, "dv": info.field_3_dv},
+                "dv": info.dv,
+                "expiry_factor": info.expiry_factor,
+                "expiry": info.expiry,
+                "value_factor": info.value_factor,
+                "value": info.value}
 
     def get_bar(self) -> str:
         """
         Returns the barcode string representation.
         """
-        return (f"{self.__code_info['bank']}"
-                f"{self.__code_info['currency']}"
-                f"{self.__code_info['dv']}"
-                f"{self.__code_info['expiry_factor']}"
-                f"{self.__code_info['value_factor']}"
-                f"{self.__code_info['field_1']['info']}"
-                f"{self.__code_info['field_2']['info']}"
-                f"{self.__code_info['field_3']['info']}")
+        info = self.__code_info
+        return "".join((info.bank, info.currency, info.dv, info.expiry_factor, info.value_factor,
+                        info.field_1_info, info.field_2_info, info.field_3_info))
 
     def get_line(self, formatted=False):
         """
@@ -172,36 +245,17 @@ class FebrabanCode:
 
         Returns the line string representation.
         """
+        info = self.__code_info
         if formatted:
-            return (f"{self.__code_info['bank']}"
-                    f"{self.__code_info['currency']}"
-                    f"{self.__code_info['field_1']['info'][:1]}"
-                    "."
-                    f"{self.__code_info['field_1']['info'][1:]}"
-                    f"{self.__code_info['field_1']['dv']}"
-                    " "
-                    f"{self.__code_info['field_2']['info'][:5]}.{self.__code_info['field_2']['info'][5:]}"
-                    f"{self.__code_info['field_2']['dv']}"
-                    " "
-                    f"{self.__code_info['field_3']['info'][:5]}.{self.__code_info['field_3']['info'][5:]}"
-                    f"{self.__code_info['field_3']['dv']}"
-                    " "
-                    f"{self.__code_info['dv']}"
-                    " "
-                    f"{self.__code_info['expiry_factor']}"
-                    f"{self.__code_info['value_factor']}")
-
-        return (f"{self.__code_info['bank']}"
-                f"{self.__code_info['currency']}"
-                f"{self.__code_info['field_1']['info']}"
-                f"{self.__code_info['field_1']['dv']}"
-                f"{self.__code_info['field_2']['info']}"
-                f"{self.__code_info['field_2']['dv']}"
-                f"{self.__code_info['field_3']['info']}"
-                f"{self.__code_info['field_3']['dv']}"
-                f"{self.__code_info['dv']}"
-                f"{self.__code_info['expiry_factor']}"
-                f"{self.__code_info['value_factor']}")
+            field_1, field_2, field_3 = info.field_1_info, info.field_2_info, info.field_3_info
+            return "".join((info.bank, info.currency, field_1[:1], ".", field_1[1:], str(info.field_1_dv), " ",
+                            field_2[:5], ".", field_2[5:], str(info.field_2_dv), " ",
+                            field_3[:5], ".", field_3[5:], str(info.field_3_dv), " ",
+                            info.dv, " ", info.expiry_factor, info.value_factor))
+
+        return "".join((info.bank, info.currency, info.field_1_info, str(info.field_1_dv),
+                        info.field_2_info, str(info.field_2_dv), info.field_3_info, str(info.field_3_dv),
+                        info.dv, info.expiry_factor, info.value_factor))
 
     def validate(self):
         """
@@ -209,15 +263,36 @@ class FebrabanCode:
 
         Returns True if the bar/line is valid, False otherwise.
         """
-        dv1_string = f"{self.__code_info['bank']}{self.__code_info['currency']}{self.__code_info['field_1']['info']}"
-        dv1_is_valid = self.__get_dv_module_10(dv1_string) == int(self.__code_info['field_1']['dv'])
-        dv2_is_valid = self.__get_dv_module_10(f"{self.__code_info['field_2']['info']}") == int(self.__code_info['field_2']['dv'])
-        dv3_is_valid = self.__get_dv_module_10(f"{self.__code_info['field_3']['info']}") == int(self.__code_info['field_3']['dv'])
+        return _is_valid(self.__code_type, self.__code)
+
+    @classmethod
+    def validate_many(cls, codes: Iterable[str], workers: Optional[int] = None) -> List[bool]:
+        """
+        - codes : Iterable[str]
+            The bar/line strings to validate.
+        - workers : int, optional
+            If greater than 1, validates contiguous chunks of codes in that many worker processes.
+
+        Validates many bar/line codes without building a FebrabanCode for each one.
+
+        Returns a list with True for each valid bar/line and False otherwise.
+        """
+        if workers is None or workers <= 1:
+            return [_is_valid(*cls.__code_match(code)) for code in codes]
+
+        codes = list(codes)
+        chunk_size = max(1, -(-len(codes) // (workers * 4)))
+        chunks = [codes[start:start + chunk_size] for start in range(0, len(codes), chunk_size)]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [is_valid for chunk in executor.map(_validate_chunk, chunks) for is_valid in chunk]
 
-        bar = self.get_bar()
-        dv_line_is_valid = self.__get_dv_module_11(f"{bar[:4]}{bar[5:]}") == int(self.__code_info["dv"])
 
-        if not all([dv1_is_valid, dv2_is_valid, dv3_is_valid, dv_line_is_valid]):
-            return False
+def _validate_chunk(codes: List[str]) -> List[bool]:
+    """
+    - codes : List[str]
+        The bar/line strings to validate in a worker process.
 
-        return True
+    Returns a list with True for each valid bar/line and False otherwise.
+    """
+    return FebrabanCode.validate_many(codes)
@@ -0,0 +1,44 @@
+import pytest
+
+from febraban_code import FebrabanCode
+
+VALID_LINES = ["23793381286000782713695000063305975520000370000",
+               "00190000090114971860168524522114675860000102656",
+               "52608.60910 39099.603084 24628.194821 4 81590830166131"]
+VALID_BARS = [FebrabanCode(line).get_bar() for line in VALID_LINES]
+INVALID_LINES = ["23793381276000782713695000063305975520000370000",  # field 1 check digit
+                 "00190000090114971860168524522114675860000102657",  # value changed, general check digit
+                 "52608.60910 39099.603085 24628.194821 4 81590830166131"]  # field 2 check digit
+INVALID_BARS = ["34191091001219011004141140141141000000120100",
+                "23790975520000370003381260007827139500006331"]
+CODES = VALID_LINES + VALID_BARS + INVALID_LINES + INVALID_BARS
+
+
+def test_validate():
+    assert all(FebrabanCode(code).validate() for code in VALID_LINES + VALID_BARS)
+    assert not any(FebrabanCode(code).validate() for code in INVALID_LINES + INVALID_BARS)
+
+
+def test_validate_many_matches_validate():
+    assert FebrabanCode.validate_many(CODES) == [FebrabanCode(code).validate() for code in CODES]
+
+
+def test_validate_many_accepts_iterables():
+    assert FebrabanCode.validate_many(iter(CODES)) == FebrabanCode.validate_many(CODES)
+    assert FebrabanCode.validate_many([]) == []
+
+
+@pytest.mark.parametrize("code", ["123", "1" * 45, "2379338128600078271369500006330597552000037000a"])
+def test_validate_many_rejects_malformed_codes(code):
+    with pytest.raises(ValueError):
+        FebrabanCode.validate_many(VALID_LINES + [code])
+
+
+def test_validate_many_with_workers_matches_serial():
+    codes = CODES * 50
+    assert FebrabanCode.validate_many(codes, workers=2) == FebrabanCode.validate_many(codes)
+
+
+def test_validate_many_with_workers_raises_on_malformed_code():
+    with pytest.raises(ValueError):
+        FebrabanCode.validate_many(CODES * 10 + ["123"], workers=2)